@@ -105,6 +105,12 @@ fi
 
 cp lakbay.py "$INSTALL_DIR/"
 cp runner.py "$INSTALL_DIR/"
+# Copy the compiled transpiler too if it was built (see setup.py)
+for ext in lakbay.*.so lakbay.*.pyd; do
+    if [ -f "$ext" ]; then
+        cp "$ext" "$INSTALL_DIR/"
+    fi
+done
 echo -e "${GREEN}✓${NC} Files copied to $INSTALL_DIR"
 
 # Copy examples if they exist
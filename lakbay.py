@@ -6,229 +6,297 @@ A compiled, object-oriented language
 FILE: lakbay.py
 """
 
+import io
 import re
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, TypeVar
+
+# Token types. Small ints, so type checks are integer compares and the
+# operator tables below can be indexed by type directly.
+_TYPE_NAMES = (
+    'NUMBER', 'IDENTIFIER', 'KEYWORD', 'STRING',
+    'EQ', 'NEQ', 'LEQ', 'GEQ', 'AND', 'OR', 'INC', 'DEC',
+    'PLUS', 'MINUS', 'MULT', 'DIV', 'ASSIGN', 'LT', 'GT', 'NOT',
+    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET',
+    'SEMI', 'COMMA', 'DOT', 'COLON'
+)
+(NUMBER, IDENTIFIER, KEYWORD, STRING,
+ EQ, NEQ, LEQ, GEQ, AND, OR, INC, DEC,
+ PLUS, MINUS, MULT, DIV, ASSIGN, LT, GT, NOT,
+ LPAREN, RPAREN, LBRACE, RBRACE, LBRACKET, RBRACKET,
+ SEMI, COMMA, DOT, COLON) = range(len(_TYPE_NAMES))
+
+_T = TypeVar('_T')
+
+def _by_type(entries: Dict[int, _T]) -> Tuple[Optional[_T], ...]:
+    """Lookup table indexed by token type, None for types not in entries"""
+    return tuple(entries.get(token_type) for token_type in range(len(_TYPE_NAMES)))
+
+# Binary operators for the expression parser:
+# token type -> (precedence, C++ operator), higher binds tighter
+_BINARY_OPS = _by_type({
+    OR: (1, '||'),
+    AND: (2, '&&'),
+    EQ: (3, '=='), NEQ: (3, '!='),
+    LT: (4, '<'), GT: (4, '>'), LEQ: (4, '<='), GEQ: (4, '>='),
+    PLUS: (5, '+'), MINUS: (5, '-'),
+    MULT: (6, '*'), DIV: (6, '/')
+})
+_UNARY_OPS = _by_type({MINUS: '-', NOT: '!'})
+
+_VISIBILITY = frozenset(('public', 'private'))
+_VAR_TYPES = frozenset(('int', 'float', 'string', 'bool'))
 
-@dataclass
 class Token:
-    type: str
-    value: str
-    line: int
+    __slots__ = ('type', 'value', 'line')
+    
+    def __init__(self, type: int, value: str, line: int):
+        self.type = type
+        self.value = value
+        self.line = line
+    
+    def __repr__(self) -> str:
+        return f'Token(type={_TYPE_NAMES[self.type]}, value={self.value!r}, line={self.line!r})'
+
+# Master token pattern: one alternation scanned by the regex engine instead
+# of a per-character Python loop. Characters matching no group are skipped.
+_MASTER = re.compile(r'''
+    (?P<WS>\s+)
+  | (?P<COMMENT>//[^\n]*)
+  | (?P<NUMBER>\d[\d.]*)
+  | (?P<IDENT>[^\W\d]\w*)
+  | (?P<STRING>"(?P<BODY>(?:[^"\\]|\\.|\\\Z)*)"?)
+  | (?P<OP2>==|!=|<=|>=|&&|\|\||\+\+|--)
+  | (?P<OP1>[-+*/=<>!(){}\[\];,.:])
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
+_KEYWORDS = frozenset({
+    'class', 'extends', 'func', 'return', 'if', 'else',
+    'while', 'for', 'new', 'this', 'public', 'private',
+    'int', 'float', 'string', 'bool', 'void', 'array',
+    'print', 'true', 'false'
+})
+
+_OPERATORS = {
+    '==': EQ, '!=': NEQ, '<=': LEQ, '>=': GEQ,
+    '&&': AND, '||': OR, '++': INC, '--': DEC
+}
+
+_SINGLE_CHARS = {
+    '+': PLUS, '-': MINUS, '*': MULT, '/': DIV,
+    '=': ASSIGN, '<': LT, '>': GT, '!': NOT,
+    '(': LPAREN, ')': RPAREN, '{': LBRACE, '}': RBRACE,
+    '[': LBRACKET, ']': RBRACKET, ';': SEMI, ',': COMMA,
+    '.': DOT, ':': COLON
+}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"'}
+
+_TYPE_MAP = {
+    'int': 'int',
+    'float': 'float',
+    'string': 'string',
+    'bool': 'bool',
+    'void': 'void'
+}
+
+def _unescape(m: 're.Match[str]') -> str:
+    return _ESCAPES.get(m.group(1), m.group(1))
+
+@lru_cache(maxsize=32)
+def _convert_type(lakbay_type: str) -> str:
+    return _TYPE_MAP.get(lakbay_type, lakbay_type)
 
 class Lexer:
     def __init__(self, code: str):
         self.code = code
-        self.pos = 0
         self.line = 1
-        self.tokens = []
         
     def tokenize(self) -> List[Token]:
-        keywords = {
-            'class', 'extends', 'func', 'return', 'if', 'else', 
-            'while', 'for', 'new', 'this', 'public', 'private',
-            'int', 'float', 'string', 'bool', 'void', 'array',
-            'print', 'true', 'false'
-        }
-        
-        while self.pos < len(self.code):
-            # Skip whitespace
-            if self.code[self.pos].isspace():
-                if self.code[self.pos] == '\n':
-                    self.line += 1
-                self.pos += 1
-                continue
-            
-            # Skip comments
-            if self.pos < len(self.code) - 1 and self.code[self.pos:self.pos+2] == '//':
-                while self.pos < len(self.code) and self.code[self.pos] != '\n':
-                    self.pos += 1
-                continue
-            
-            # Numbers
-            if self.code[self.pos].isdigit():
-                num = ''
-                while self.pos < len(self.code) and (self.code[self.pos].isdigit() or self.code[self.pos] == '.'):
-                    num += self.code[self.pos]
-                    self.pos += 1
-                self.tokens.append(Token('NUMBER', num, self.line))
-                continue
-            
-            # Identifiers and keywords
-            if self.code[self.pos].isalpha() or self.code[self.pos] == '_':
-                ident = ''
-                while self.pos < len(self.code) and (self.code[self.pos].isalnum() or self.code[self.pos] == '_'):
-                    ident += self.code[self.pos]
-                    self.pos += 1
-                token_type = 'KEYWORD' if ident in keywords else 'IDENTIFIER'
-                self.tokens.append(Token(token_type, ident, self.line))
-                continue
-            
-            # Strings
-            if self.code[self.pos] == '"':
-                self.pos += 1
-                string = ''
-                while self.pos < len(self.code) and self.code[self.pos] != '"':
-                    if self.code[self.pos] == '\\' and self.pos + 1 < len(self.code):
-                        self.pos += 1
-                        escape_chars = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"'}
-                        string += escape_chars.get(self.code[self.pos], self.code[self.pos])
-                    else:
-                        string += self.code[self.pos]
-                    self.pos += 1
-                self.pos += 1
-                self.tokens.append(Token('STRING', string, self.line))
-                continue
-            
-            # Operators and punctuation
-            operators = {
-                '==': 'EQ', '!=': 'NEQ', '<=': 'LEQ', '>=': 'GEQ',
-                '&&': 'AND', '||': 'OR', '++': 'INC', '--': 'DEC'
-            }
-            
-            two_char = self.code[self.pos:self.pos+2]
-            if two_char in operators:
-                self.tokens.append(Token(operators[two_char], two_char, self.line))
-                self.pos += 2
-                continue
-            
-            single_chars = {
-                '+': 'PLUS', '-': 'MINUS', '*': 'MULT', '/': 'DIV',
-                '=': 'ASSIGN', '<': 'LT', '>': 'GT', '!': 'NOT',
-                '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE',
-                '[': 'LBRACKET', ']': 'RBRACKET', ';': 'SEMI', ',': 'COMMA',
-                '.': 'DOT', ':': 'COLON'
-            }
-            
-            if self.code[self.pos] in single_chars:
-                char = self.code[self.pos]
-                self.tokens.append(Token(single_chars[char], char, self.line))
-                self.pos += 1
-                continue
+        return list(self.tokens())
+    
+    def tokens(self) -> Iterator[Token]:
+        # Tokens are produced on demand, so the transpiler can consume the
+        # source without a full token list held in memory
+        for m in _MASTER.finditer(self.code):
+            kind = m.lastgroup
+            text = m.group()
             
-            self.pos += 1
-        
-        return self.tokens
+            if kind == 'WS':
+                self.line += text.count('\n')
+            elif kind == 'IDENT':
+                token_type = KEYWORD if text in _KEYWORDS else IDENTIFIER
+                yield Token(token_type, text, self.line)
+            elif kind == 'NUMBER':
+                yield Token(NUMBER, text, self.line)
+            elif kind == 'STRING':
+                # An unterminated string runs to the end of the input
+                body = m.group('BODY')
+                if '\\' in body:
+                    body = _ESCAPE.sub(_unescape, body)
+                yield Token(STRING, body, self.line)
+                self.line += text.count('\n')
+            elif kind == 'OP2':
+                yield Token(_OPERATORS[text], text, self.line)
+            elif kind == 'OP1':
+                yield Token(_SINGLE_CHARS[text], text, self.line)
 
 class Transpiler:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.pos = 0
-        self.output = []
+    def __init__(self, tokens: Iterable[Token]):
+        # One token of lookahead over the lexer's stream
+        self._iter = iter(tokens)
+        self._cur = next(self._iter, None)
+        self._out = io.StringIO()
+        self._indents = ['']
         self.indent = 0
-        self.classes = {}
+        self.classes: Dict[str, str] = {}
+        
+        # Keyword dispatch tables, keyed by token value
+        self._stmt_handlers: Dict[str, Callable[[], None]] = {
+            'return': self.transpile_return,
+            'if': self.transpile_if,
+            'while': self.transpile_while,
+            'for': self.transpile_for,
+            'print': self.transpile_print,
+        }
+        for type_name in _VAR_TYPES:
+            self._stmt_handlers[type_name] = self.transpile_var_declaration
+        
+        self._primary_handlers: Dict[str, Callable[[], str]] = {
+            'this': self.transpile_literal_keyword,
+            'true': self.transpile_literal_keyword,
+            'false': self.transpile_literal_keyword,
+            'new': self.transpile_new,
+        }
         
     def current(self) -> Optional[Token]:
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+        return self._cur
     
-    def advance(self):
-        self.pos += 1
+    def advance(self) -> None:
+        self._cur = next(self._iter, None)
     
-    def expect(self, token_type: str, value: str = None) -> Token:
+    def expect(self, token_type: int, value: Optional[str] = None) -> Token:
         token = self.current()
         if not token or token.type != token_type:
-            raise Exception(f"Line {token.line if token else '?'}: Expected {token_type}, got {token.type if token else 'EOF'}")
+            raise Exception(f"Line {token.line if token else '?'}: Expected {_TYPE_NAMES[token_type]}, got {_TYPE_NAMES[token.type] if token else 'EOF'}")
         if value and token.value != value:
             raise Exception(f"Line {token.line}: Expected '{value}', got '{token.value}'")
         self.advance()
         return token
     
-    def write(self, code: str):
-        self.output.append('    ' * self.indent + code)
+    def write(self, code: str) -> None:
+        # Lines go straight into one buffer, newline first so the output has
+        # no trailing newline. Each indent prefix is built only once.
+        indents = self._indents
+        if self.indent >= len(indents):
+            indents.extend('    ' * i for i in range(len(indents), self.indent + 1))
+        out = self._out
+        out.write('\n')
+        out.write(indents[self.indent])
+        out.write(code)
     
     def transpile(self) -> str:
-        self.output = [
-            '#include <iostream>',
-            '#include <string>',
-            '#include <vector>',
-            'using namespace std;',
-            ''
-        ]
-        
-        while self.current():
-            if self.current().type == 'KEYWORD' and self.current().value == 'class':
+        self._out.write(
+            '#include <iostream>\n'
+            '#include <string>\n'
+            '#include <vector>\n'
+            'using namespace std;\n'
+        )
+        
+        token = self.current()
+        while token:
+            if token.type == KEYWORD and token.value == 'class':
                 self.transpile_class()
             else:
                 self.advance()
+            token = self.current()
         
         # Add main function
-        self.output.append('\nint main() {')
-        self.output.append('    cout << "Lakbay Program Running..." << endl;')
-        self.output.append('    return 0;')
-        self.output.append('}')
+        self.write('\nint main() {')
+        self.indent += 1
+        self.write('cout << "Lakbay Program Running..." << endl;')
+        self.write('return 0;')
+        self.indent -= 1
+        self.write('}')
         
-        return '\n'.join(self.output)
+        return self._out.getvalue()
     
-    def transpile_class(self):
-        self.expect('KEYWORD', 'class')
-        class_name = self.expect('IDENTIFIER').value
+    def transpile_class(self) -> None:
+        self.expect(KEYWORD, 'class')
+        class_name = self.expect(IDENTIFIER).value
         
         parent = None
-        if self.current() and self.current().type == 'KEYWORD' and self.current().value == 'extends':
+        token = self.current()
+        if token and token.type == KEYWORD and token.value == 'extends':
             self.advance()
-            parent = self.expect('IDENTIFIER').value
+            parent = self.expect(IDENTIFIER).value
         
-        self.expect('LBRACE')
+        self.expect(LBRACE)
         
         self.write(f'\nclass {class_name}' + (f' : public {parent}' if parent else '') + ' {')
         self.write('public:')
         self.indent += 1
         
         # Parse class body
-        while self.current() and not (self.current().type == 'RBRACE'):
-            if self.current().type == 'KEYWORD':
-                if self.current().value in ['public', 'private']:
-                    visibility = self.current().value
+        token = self.current()
+        while token and token.type != RBRACE:
+            if token.type == KEYWORD:
+                if token.value in _VISIBILITY:
+                    visibility = token.value
                     self.advance()
-                    self.expect('COLON')
+                    self.expect(COLON)
                     self.indent -= 1
                     self.write(f'{visibility}:')
                     self.indent += 1
-                elif self.current().value == 'func':
+                elif token.value == 'func':
                     self.transpile_method(class_name)
                 else:
                     self.transpile_property()
             else:
                 self.advance()
+            token = self.current()
         
         self.indent -= 1
         self.write('};')
-        self.expect('RBRACE')
+        self.expect(RBRACE)
     
-    def transpile_property(self):
-        type_name = self.expect('KEYWORD').value
-        cpp_type = self.convert_type(type_name)
-        var_name = self.expect('IDENTIFIER').value
+    def transpile_property(self) -> None:
+        type_name = self.expect(KEYWORD).value
+        cpp_type = _convert_type(type_name)
+        var_name = self.expect(IDENTIFIER).value
         
-        if self.current() and self.current().type == 'ASSIGN':
+        token = self.current()
+        if token and token.type == ASSIGN:
             self.advance()
             value = self.transpile_expression()
             self.write(f'{cpp_type} {var_name} = {value};')
         else:
             self.write(f'{cpp_type} {var_name};')
         
-        self.expect('SEMI')
+        self.expect(SEMI)
     
-    def transpile_method(self, class_name: str):
-        self.expect('KEYWORD', 'func')
+    def transpile_method(self, class_name: str) -> None:
+        self.expect(KEYWORD, 'func')
         
-        method_name = self.expect('IDENTIFIER').value
+        method_name = self.expect(IDENTIFIER).value
         is_constructor = (method_name == class_name)
         
-        self.expect('LPAREN')
+        self.expect(LPAREN)
         params = []
-        while self.current() and self.current().type != 'RPAREN':
-            param_type = self.expect('KEYWORD').value
-            param_name = self.expect('IDENTIFIER').value
-            params.append(f'{self.convert_type(param_type)} {param_name}')
-            if self.current() and self.current().type == 'COMMA':
+        while self._cur is not None and self._cur.type != RPAREN:
+            param_type = self.expect(KEYWORD).value
+            param_name = self.expect(IDENTIFIER).value
+            params.append(f'{_convert_type(param_type)} {param_name}')
+            if self._cur is not None and self._cur.type == COMMA:
                 self.advance()
-        self.expect('RPAREN')
+        self.expect(RPAREN)
         
         return_type = 'void'
-        if not is_constructor and self.current() and self.current().type == 'COLON':
+        if not is_constructor and self._cur is not None and self._cur.type == COLON:
             self.advance()
-            return_type = self.convert_type(self.expect('KEYWORD').value)
+            return_type = _convert_type(self.expect(KEYWORD).value)
         
         param_str = ', '.join(params)
         
@@ -237,230 +305,186 @@ class Transpiler:
         else:
             self.write(f'{return_type} {method_name}({param_str}) {{')
         
-        self.expect('LBRACE')
+        self.expect(LBRACE)
         self.indent += 1
         
         self.transpile_block()
         
         self.indent -= 1
         self.write('}')
-        self.expect('RBRACE')
+        self.expect(RBRACE)
     
-    def transpile_block(self):
-        while self.current() and self.current().type != 'RBRACE':
+    def transpile_block(self) -> None:
+        while self._cur is not None and self._cur.type != RBRACE:
             self.transpile_statement()
     
-    def transpile_statement(self):
+    def transpile_statement(self) -> None:
         token = self.current()
         if not token:
             return
         
-        if token.type == 'KEYWORD':
-            if token.value == 'return':
-                self.advance()
-                if self.current() and self.current().type != 'SEMI':
-                    expr = self.transpile_expression()
-                    self.write(f'return {expr};')
-                else:
-                    self.write('return;')
-                self.expect('SEMI')
-            elif token.value == 'if':
-                self.transpile_if()
-            elif token.value == 'while':
-                self.transpile_while()
-            elif token.value == 'for':
-                self.transpile_for()
-            elif token.value == 'print':
-                self.transpile_print()
-            elif token.value in ['int', 'float', 'string', 'bool']:
-                self.transpile_var_declaration()
-        else:
+        if token.type == KEYWORD:
+            handler = self._stmt_handlers.get(token.value)
+            if handler:
+                handler()
+                return
+        
+        expr = self.transpile_expression()
+        self.write(f'{expr};')
+        self.expect(SEMI)
+    
+    def transpile_return(self) -> None:
+        self.expect(KEYWORD, 'return')
+        token = self.current()
+        if token and token.type != SEMI:
             expr = self.transpile_expression()
-            self.write(f'{expr};')
-            self.expect('SEMI')
+            self.write(f'return {expr};')
+        else:
+            self.write('return;')
+        self.expect(SEMI)
     
-    def transpile_print(self):
-        self.expect('KEYWORD', 'print')
-        self.expect('LPAREN')
-        args = []
-        while self.current() and self.current().type != 'RPAREN':
-            args.append(self.transpile_expression())
-            if self.current() and self.current().type == 'COMMA':
-                self.advance()
-        self.expect('RPAREN')
-        self.expect('SEMI')
-        
-        print_stmt = 'cout'
-        for arg in args:
-            print_stmt += f' << {arg}'
-        print_stmt += ' << endl;'
-        self.write(print_stmt)
+    def transpile_print(self) -> None:
+        self.expect(KEYWORD, 'print')
+        self.expect(LPAREN)
+        args = self.transpile_args()
+        self.expect(SEMI)
+        
+        if args:
+            self.write('cout << ' + ' << '.join(args) + ' << endl;')
+        else:
+            self.write('cout << endl;')
     
-    def transpile_if(self):
-        self.expect('KEYWORD', 'if')
-        self.expect('LPAREN')
+    def transpile_if(self) -> None:
+        self.expect(KEYWORD, 'if')
+        self.expect(LPAREN)
         condition = self.transpile_expression()
-        self.expect('RPAREN')
-        self.expect('LBRACE')
+        self.expect(RPAREN)
+        self.expect(LBRACE)
         
         self.write(f'if ({condition}) {{')
         self.indent += 1
         self.transpile_block()
         self.indent -= 1
         self.write('}')
-        self.expect('RBRACE')
+        self.expect(RBRACE)
         
-        if self.current() and self.current().type == 'KEYWORD' and self.current().value == 'else':
+        token = self.current()
+        if token and token.type == KEYWORD and token.value == 'else':
             self.advance()
-            self.expect('LBRACE')
+            self.expect(LBRACE)
             self.write('else {')
             self.indent += 1
             self.transpile_block()
             self.indent -= 1
             self.write('}')
-            self.expect('RBRACE')
+            self.expect(RBRACE)
     
-    def transpile_while(self):
-        self.expect('KEYWORD', 'while')
-        self.expect('LPAREN')
+    def transpile_while(self) -> None:
+        self.expect(KEYWORD, 'while')
+        self.expect(LPAREN)
         condition = self.transpile_expression()
-        self.expect('RPAREN')
-        self.expect('LBRACE')
+        self.expect(RPAREN)
+        self.expect(LBRACE)
         
         self.write(f'while ({condition}) {{')
         self.indent += 1
         self.transpile_block()
         self.indent -= 1
         self.write('}')
-        self.expect('RBRACE')
+        self.expect(RBRACE)
     
-    def transpile_for(self):
-        self.expect('KEYWORD', 'for')
-        self.expect('LPAREN')
+    def transpile_for(self) -> None:
+        self.expect(KEYWORD, 'for')
+        self.expect(LPAREN)
         init = self.transpile_expression()
-        self.expect('SEMI')
+        self.expect(SEMI)
         condition = self.transpile_expression()
-        self.expect('SEMI')
+        self.expect(SEMI)
         update = self.transpile_expression()
-        self.expect('RPAREN')
-        self.expect('LBRACE')
+        self.expect(RPAREN)
+        self.expect(LBRACE)
         
         self.write(f'for ({init}; {condition}; {update}) {{')
         self.indent += 1
         self.transpile_block()
         self.indent -= 1
         self.write('}')
-        self.expect('RBRACE')
+        self.expect(RBRACE)
     
-    def transpile_var_declaration(self):
-        type_name = self.expect('KEYWORD').value
-        cpp_type = self.convert_type(type_name)
-        var_name = self.expect('IDENTIFIER').value
+    def transpile_var_declaration(self) -> None:
+        type_name = self.expect(KEYWORD).value
+        cpp_type = _convert_type(type_name)
+        var_name = self.expect(IDENTIFIER).value
         
-        if self.current() and self.current().type == 'ASSIGN':
+        token = self.current()
+        if token and token.type == ASSIGN:
             self.advance()
             value = self.transpile_expression()
             self.write(f'{cpp_type} {var_name} = {value};')
         else:
             self.write(f'{cpp_type} {var_name};')
         
-        self.expect('SEMI')
+        self.expect(SEMI)
     
     def transpile_expression(self) -> str:
-        return self.transpile_logical_or()
-    
-    def transpile_logical_or(self) -> str:
-        left = self.transpile_logical_and()
-        while self.current() and self.current().type == 'OR':
-            self.advance()
-            right = self.transpile_logical_and()
-            left = f'({left} || {right})'
-        return left
-    
-    def transpile_logical_and(self) -> str:
-        left = self.transpile_equality()
-        while self.current() and self.current().type == 'AND':
-            self.advance()
-            right = self.transpile_equality()
-            left = f'({left} && {right})'
-        return left
-    
-    def transpile_equality(self) -> str:
-        left = self.transpile_comparison()
-        while self.current() and self.current().type in ['EQ', 'NEQ']:
-            op = '==' if self.current().type == 'EQ' else '!='
-            self.advance()
-            right = self.transpile_comparison()
-            left = f'({left} {op} {right})'
-        return left
-    
-    def transpile_comparison(self) -> str:
-        left = self.transpile_term()
-        while self.current() and self.current().type in ['LT', 'GT', 'LEQ', 'GEQ']:
-            op = {'LT': '<', 'GT': '>', 'LEQ': '<=', 'GEQ': '>='}[self.current().type]
-            self.advance()
-            right = self.transpile_term()
-            left = f'({left} {op} {right})'
-        return left
-    
-    def transpile_term(self) -> str:
-        left = self.transpile_factor()
-        while self.current() and self.current().type in ['PLUS', 'MINUS']:
-            op = '+' if self.current().type == 'PLUS' else '-'
-            self.advance()
-            right = self.transpile_factor()
-            left = f'({left} {op} {right})'
-        return left
+        return self.transpile_binary(1)
     
-    def transpile_factor(self) -> str:
+    def transpile_binary(self, min_prec: int) -> str:
+        # Precedence climbing: one frame per operator level actually used,
+        # instead of one per grammar level for every operand
         left = self.transpile_unary()
-        while self.current() and self.current().type in ['MULT', 'DIV']:
-            op = '*' if self.current().type == 'MULT' else '/'
+        while self._cur is not None:
+            entry = _BINARY_OPS[self._cur.type]
+            if entry is None or entry[0] < min_prec:
+                break
+            prec, op = entry
             self.advance()
-            right = self.transpile_unary()
+            right = self.transpile_binary(prec + 1)
             left = f'({left} {op} {right})'
         return left
     
     def transpile_unary(self) -> str:
-        if self.current() and self.current().type in ['MINUS', 'NOT']:
-            op = '-' if self.current().type == 'MINUS' else '!'
-            self.advance()
-            return f'{op}{self.transpile_unary()}'
+        if self._cur is not None:
+            op = _UNARY_OPS[self._cur.type]
+            if op is not None:
+                self.advance()
+                return f'{op}{self.transpile_unary()}'
         return self.transpile_postfix()
     
+    def transpile_args(self) -> List[str]:
+        # Comma-separated arguments after an opening '(', through the ')'
+        args = []
+        while self._cur is not None and self._cur.type != RPAREN:
+            args.append(self.transpile_expression())
+            if self._cur is not None and self._cur.type == COMMA:
+                self.advance()
+        self.expect(RPAREN)
+        return args
+    
     def transpile_postfix(self) -> str:
         expr = self.transpile_primary()
         
-        while self.current():
-            if self.current().type == 'DOT':
+        while self._cur is not None:
+            token_type = self._cur.type
+            if token_type == DOT:
                 self.advance()
-                member = self.expect('IDENTIFIER').value
-                if self.current() and self.current().type == 'LPAREN':
+                member = self.expect(IDENTIFIER).value
+                if self._cur is not None and self._cur.type == LPAREN:
                     self.advance()
-                    args = []
-                    while self.current() and self.current().type != 'RPAREN':
-                        args.append(self.transpile_expression())
-                        if self.current() and self.current().type == 'COMMA':
-                            self.advance()
-                    self.expect('RPAREN')
+                    args = self.transpile_args()
                     expr = f'{expr}.{member}({", ".join(args)})'
                 else:
                     expr = f'{expr}.{member}'
-            elif self.current().type == 'LPAREN':
+            elif token_type == LPAREN:
                 self.advance()
-                args = []
-                while self.current() and self.current().type != 'RPAREN':
-                    args.append(self.transpile_expression())
-                    if self.current() and self.current().type == 'COMMA':
-                        self.advance()
-                self.expect('RPAREN')
+                args = self.transpile_args()
                 expr = f'{expr}({", ".join(args)})'
-            elif self.current().type == 'LBRACKET':
+            elif token_type == LBRACKET:
                 self.advance()
                 index = self.transpile_expression()
-                self.expect('RBRACKET')
+                self.expect(RBRACKET)
                 expr = f'{expr}[{index}]'
-            elif self.current().type == 'ASSIGN':
+            elif token_type == ASSIGN:
                 self.advance()
                 value = self.transpile_expression()
                 expr = f'{expr} = {value}'
@@ -471,61 +495,46 @@ class Transpiler:
     
     def transpile_primary(self) -> str:
         token = self.current()
+        if token is None:
+            raise Exception('Line ?: Unexpected end of input')
         
-        if token.type == 'NUMBER':
+        if token.type == NUMBER:
             self.advance()
             return token.value
-        elif token.type == 'STRING':
+        elif token.type == STRING:
             self.advance()
             return f'"{token.value}"'
-        elif token.type == 'IDENTIFIER':
+        elif token.type == IDENTIFIER:
             self.advance()
             return token.value
-        elif token.type == 'KEYWORD' and token.value == 'this':
-            self.advance()
-            return 'this'
-        elif token.type == 'KEYWORD' and token.value == 'true':
-            self.advance()
-            return 'true'
-        elif token.type == 'KEYWORD' and token.value == 'false':
-            self.advance()
-            return 'false'
-        elif token.type == 'KEYWORD' and token.value == 'new':
-            self.advance()
-            class_name = self.expect('IDENTIFIER').value
-            self.expect('LPAREN')
-            args = []
-            while self.current() and self.current().type != 'RPAREN':
-                args.append(self.transpile_expression())
-                if self.current() and self.current().type == 'COMMA':
-                    self.advance()
-            self.expect('RPAREN')
-            return f'new {class_name}({", ".join(args)})'
-        elif token.type == 'LPAREN':
+        elif token.type == KEYWORD:
+            handler = self._primary_handlers.get(token.value)
+            if handler:
+                return handler()
+        elif token.type == LPAREN:
             self.advance()
             expr = self.transpile_expression()
-            self.expect('RPAREN')
+            self.expect(RPAREN)
             return f'({expr})'
         
-        raise Exception(f'Line {token.line}: Unexpected token: {token.type} {token.value}')
+        raise Exception(f'Line {token.line}: Unexpected token: {_TYPE_NAMES[token.type]} {token.value}')
     
-    def convert_type(self, lakbay_type: str) -> str:
-        type_map = {
-            'int': 'int',
-            'float': 'float',
-            'string': 'string',
-            'bool': 'bool',
-            'void': 'void'
-        }
-        return type_map.get(lakbay_type, lakbay_type)
+    def transpile_literal_keyword(self) -> str:
+        # 'this', 'true' and 'false' are spelled the same in C++
+        return self.expect(KEYWORD).value
+    
+    def transpile_new(self) -> str:
+        self.expect(KEYWORD, 'new')
+        class_name = self.expect(IDENTIFIER).value
+        self.expect(LPAREN)
+        args = self.transpile_args()
+        return f'new {class_name}({", ".join(args)})'
 
 def compile_lakbay(source_code: str) -> str:
     """Main compilation function"""
     try:
         lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-        
-        transpiler = Transpiler(tokens)
+        transpiler = Transpiler(lexer.tokens())
         cpp_code = transpiler.transpile()
         
         return cpp_code
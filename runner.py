@@ -5,29 +5,155 @@ Transpiles, compiles, and runs .lakbay files automatically
 Supports both g++ and clang++ compilers
 """
 
-from lakbay import compile_lakbay
+import lakbay
 import sys
 import os
 import subprocess
 import platform
+import hashlib
+import shutil
+
+# Builds are cached once per generated C++ in CACHE_DIR/builds, so a
+# comments-only edit skips the C++ compile. CACHE_DIR/sources maps each
+# source file's contents to its build, so re-running an unchanged file
+# also skips the transpile. Only the most recently used builds are kept;
+# delete CACHE_DIR to clear it.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'lakbay')
+CACHE_ENTRIES = 20
 
 def find_compiler():
     """Find available C++ compiler (g++ or clang++)"""
     compilers = ['clang++', 'g++']
     
+    # A PATH lookup is enough; no need to spawn '<compiler> --version'
     for compiler in compilers:
-        try:
-            result = subprocess.run([compiler, '--version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-            if result.returncode == 0:
-                return compiler
-        except:
-            continue
+        if shutil.which(compiler):
+            return compiler
     
     return None
 
+def hash_file(path):
+    """Digest of a file's contents, read in chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def print_source_preview(source_code, context=15):
+    """Print a numbered listing, or only the first and last lines if long"""
+    total = source_code.count('\n') + 1
+    if total <= 2 * context:
+        for i, line in enumerate(source_code.split('\n'), 1):
+            print(f"{i:3}: {line}")
+        return
+    
+    # Slice out just the lines shown, so a large source is never split
+    pos = 0
+    for i in range(1, context + 1):
+        end = source_code.find('\n', pos)
+        print(f"{i:3}: {source_code[pos:end]}")
+        pos = end + 1
+    print(f"     ... ({total - 2 * context} more lines) ...")
+    
+    tail = []
+    end = len(source_code)
+    for _ in range(context):
+        start = source_code.rfind('\n', 0, end) + 1
+        tail.append((start, end))
+        end = start - 1
+    for i, (start, end) in enumerate(reversed(tail), total - context + 1):
+        print(f"{i:3}: {source_code[start:end]}")
+
+def get_build_flags():
+    """C++ compiler flags, LAKBAY_FAST_BUILD=1 for quicker development builds"""
+    if os.environ.get('LAKBAY_FAST_BUILD') == '1':
+        return ['-std=c++11', '-O0', '-pipe']
+    return ['-std=c++11']
+
+def get_cache_key(*parts):
+    """Cache key for a build, from everything that affects it"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def restore_cached_build(build_key, output_cpp):
+    """Copy a cached C++ file and executable into place, True on a cache hit"""
+    build_dir = os.path.join(CACHE_DIR, 'builds', build_key)
+    cached_cpp = os.path.join(build_dir, 'output.cpp')
+    cached_exe = os.path.join(build_dir, 'program')
+    if not (os.path.exists(cached_cpp) and os.path.exists(cached_exe)):
+        return False
+    
+    try:
+        shutil.copyfile(cached_cpp, output_cpp)
+        shutil.copy2(cached_exe, 'program')
+        # Mark as recently used so pruning keeps it
+        os.utime(build_dir)
+    except OSError:
+        return False
+    return True
+
+def store_cached_build(build_key, output_cpp):
+    """Save the C++ file and executable for the next run of the same C++"""
+    build_dir = os.path.join(CACHE_DIR, 'builds', build_key)
+    try:
+        os.makedirs(build_dir, exist_ok=True)
+        shutil.copyfile(output_cpp, os.path.join(build_dir, 'output.cpp'))
+        # Copy then rename, so an interrupted copy never looks like a hit
+        tmp_exe = os.path.join(build_dir, 'program.tmp')
+        shutil.copy2('program', tmp_exe)
+        os.replace(tmp_exe, os.path.join(build_dir, 'program'))
+    except OSError as e:
+        print(f"   ⚠️  Warning: Could not cache build: {e}")
+    
+    prune_cache('builds')
+
+def lookup_cached_source(source_key):
+    """Build key last produced from this source, or None"""
+    source_file = os.path.join(CACHE_DIR, 'sources', source_key)
+    try:
+        with open(source_file, 'r', encoding='utf-8') as f:
+            build_key = f.read().strip()
+        os.utime(source_file)
+    except OSError:
+        return None
+    return build_key or None
+
+def store_cached_source(source_key, build_key):
+    """Remember which build a source produced, without copying the build"""
+    sources_dir = os.path.join(CACHE_DIR, 'sources')
+    try:
+        os.makedirs(sources_dir, exist_ok=True)
+        tmp_file = os.path.join(sources_dir, source_key + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(build_key)
+        os.replace(tmp_file, os.path.join(sources_dir, source_key))
+    except OSError as e:
+        print(f"   ⚠️  Warning: Could not cache build: {e}")
+    
+    prune_cache('sources')
+
+def prune_cache(kind, keep=CACHE_ENTRIES):
+    """Delete all but the most recently used entries of one kind"""
+    kind_dir = os.path.join(CACHE_DIR, kind)
+    try:
+        entries = [os.path.join(kind_dir, name) for name in os.listdir(kind_dir)]
+        entries.sort(key=os.path.getmtime, reverse=True)
+    except OSError:
+        return
+    
+    for entry in entries[keep:]:
+        if os.path.isdir(entry):
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            try:
+                os.remove(entry)
+            except OSError:
+                pass
+
 def main():
     print("╔═══════════════════════════════════════╗")
     print("║   LAKBAY PROGRAMMING LANGUAGE v1.0    ║")
@@ -50,7 +176,7 @@ def main():
     
     print(f"📄 Reading: {lakbay_file}")
     
-    # Read source code
+    # Read source code once; the cache key, preview and build all use this copy
     try:
         with open(lakbay_file, 'r', encoding='utf-8') as f:
             source_code = f.read()
@@ -65,98 +191,114 @@ def main():
     print("=" * 50)
     print("LAKBAY SOURCE CODE:")
     print("=" * 50)
-    lines = source_code.split('\n')
-    if len(lines) > 30:
-        for i, line in enumerate(lines[:15], 1):
-            print(f"{i:3}: {line}")
-        print(f"     ... ({len(lines) - 30} more lines) ...")
-        for i, line in enumerate(lines[-15:], len(lines) - 14):
-            print(f"{i:3}: {line}")
-    else:
-        for i, line in enumerate(lines, 1):
-            print(f"{i:3}: {line}")
+    print_source_preview(source_code)
     print("=" * 50)
     print()
     
-    # Step 1: Transpile to C++
-    print("🔄 [1/3] Transpiling to C++...")
-    cpp_code = compile_lakbay(source_code)
-    
-    if cpp_code.startswith("ERROR:"):
-        print(f"❌ Transpilation failed!")
-        print(cpp_code)
-        sys.exit(1)
-    
-    print("   ✓ Transpilation successful!")
-    
-    # Save to file
     output_cpp = 'output.cpp'
-    try:
-        with open(output_cpp, 'w', encoding='utf-8') as f:
-            f.write(cpp_code)
-        print(f"   ✓ Saved to: {output_cpp}")
-    except Exception as e:
-        print(f"   ❌ Error saving file: {e}")
-        sys.exit(1)
-    
-    print()
-    
-    # Step 2: Find and use compiler
-    print("🔨 [2/3] Compiling with C++ compiler...")
-    
-    compiler = find_compiler()
-    
-    if not compiler:
-        print(f"   ❌ No C++ compiler found!")
-        print(f"   Please install g++ or clang++ to compile C++ code.")
-        print(f"\n   Installation:")
-        if platform.system() == "Linux":
-            print(f"     pkg install clang          (Termux)")
-            print(f"     sudo apt-get install g++   (Linux)")
-        elif platform.system() == "Darwin":
-            print(f"     xcode-select --install")
-        elif platform.system() == "Windows":
-            print(f"     Install MinGW or Visual Studio")
-        print(f"\n   Your C++ code is saved in: {output_cpp}")
-        print(f"   You can compile it manually with:")
-        print(f"     g++ {output_cpp} -o program")
-        print(f"     OR")
-        print(f"     clang++ {output_cpp} -o program")
-        sys.exit(1)
-    
-    print(f"   ✓ Using compiler: {compiler}")
-    
-    # Compile
     output_exe = 'program.exe' if platform.system() == 'Windows' else './program'
-    compile_cmd = [compiler, output_cpp, '-o', 'program', '-std=c++11']
+    build_flags = get_build_flags()
+    # Also key on the transpiler itself, so updating Lakbay invalidates old builds
+    transpiler_stamp = hash_file(lakbay.__file__)
+    # ...and on the compiler, so switching or upgrading it rebuilds
+    compiler = find_compiler()
+    compiler_path = os.path.realpath(shutil.which(compiler)) if compiler else ''
+    source_key = get_cache_key(source_code, transpiler_stamp, compiler_path, *build_flags)
+    build_key = lookup_cached_source(source_key)
     
-    try:
-        result = subprocess.run(compile_cmd, 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=30)
+    if build_key and restore_cached_build(build_key, output_cpp):
+        print("⚡ [1/3] Source unchanged since last build")
+        print(f"   ✓ Restored {output_cpp} from cache")
+        print()
+        print("⚡ [2/3] Skipping compile")
+        print(f"   ✓ Executable: {output_exe}")
+    else:
+        # Step 1: Transpile to C++
+        print("🔄 [1/3] Transpiling to C++...")
+        cpp_code = lakbay.compile_lakbay(source_code)
         
-        if result.returncode != 0:
-            print(f"   ❌ Compilation failed!")
-            print(f"\n   Compiler errors:")
-            print(result.stderr)
+        if cpp_code.startswith("ERROR:"):
+            print(f"❌ Transpilation failed!")
+            print(cpp_code)
             sys.exit(1)
         
-        # Set execute permission (for Linux/Android/macOS)
-        if platform.system() != 'Windows':
+        print("   ✓ Transpilation successful!")
+        
+        # Save to file
+        try:
+            with open(output_cpp, 'w', encoding='utf-8') as f:
+                f.write(cpp_code)
+            print(f"   ✓ Saved to: {output_cpp}")
+        except Exception as e:
+            print(f"   ❌ Error saving file: {e}")
+            sys.exit(1)
+        
+        print()
+        
+        # Step 2: Find and use compiler
+        print("🔨 [2/3] Compiling with C++ compiler...")
+        
+        if not compiler:
+            print(f"   ❌ No C++ compiler found!")
+            print(f"   Please install g++ or clang++ to compile C++ code.")
+            print(f"\n   Installation:")
+            if platform.system() == "Linux":
+                print(f"     pkg install clang          (Termux)")
+                print(f"     sudo apt-get install g++   (Linux)")
+            elif platform.system() == "Darwin":
+                print(f"     xcode-select --install")
+            elif platform.system() == "Windows":
+                print(f"     Install MinGW or Visual Studio")
+            print(f"\n   Your C++ code is saved in: {output_cpp}")
+            print(f"   You can compile it manually with:")
+            print(f"     g++ {output_cpp} -o program")
+            print(f"     OR")
+            print(f"     clang++ {output_cpp} -o program")
+            sys.exit(1)
+        
+        print(f"   ✓ Using compiler: {compiler}")
+        
+        # Identical C++ from the same compiler (e.g. only comments changed)
+        # reuses the old executable
+        build_key = get_cache_key(cpp_code, compiler_path, *build_flags)
+        if restore_cached_build(build_key, output_cpp):
+            print("   ✓ Generated C++ unchanged, reusing cached executable")
+            print(f"   ✓ Executable: {output_exe}")
+        else:
+            # Compile
+            compile_cmd = [compiler, output_cpp, '-o', 'program'] + build_flags
+            
             try:
-                os.chmod('program', 0o755)
+                result = subprocess.run(compile_cmd, 
+                                      capture_output=True, 
+                                      text=True, 
+                                      timeout=30)
+                
+                if result.returncode != 0:
+                    print(f"   ❌ Compilation failed!")
+                    print(f"\n   Compiler errors:")
+                    print(result.stderr)
+                    sys.exit(1)
+                
+                # Set execute permission (for Linux/Android/macOS)
+                if platform.system() != 'Windows':
+                    try:
+                        os.chmod('program', 0o755)
+                    except Exception as e:
+                        print(f"   ⚠️  Warning: Could not set execute permission: {e}")
+                
+                print(f"   ✓ Compilation successful!")
+                print(f"   ✓ Executable: {output_exe}")
+            except subprocess.TimeoutExpired:
+                print(f"   ❌ Compilation timed out!")
+                sys.exit(1)
             except Exception as e:
-                print(f"   ⚠️  Warning: Could not set execute permission: {e}")
+                print(f"   ❌ Compilation error: {e}")
+                sys.exit(1)
+            
+            store_cached_build(build_key, output_cpp)
         
-        print(f"   ✓ Compilation successful!")
-        print(f"   ✓ Executable: {output_exe}")
-    except subprocess.TimeoutExpired:
-        print(f"   ❌ Compilation timed out!")
-        sys.exit(1)
-    except Exception as e:
-        print(f"   ❌ Compilation error: {e}")
-        sys.exit(1)
+        store_cached_source(source_key, build_key)
     
     print()
     
@@ -181,23 +323,12 @@ def main():
         # For Android/Termux - use absolute path
         prog_path = os.path.abspath('program')
         
-        # Try execution
+        # Try execution - the program writes straight to this terminal
+        sys.stdout.flush()
         result = subprocess.run([prog_path], 
-                              capture_output=True, 
-                              text=True, 
                               timeout=10,
                               cwd=os.getcwd())
         
-        # Display output
-        if result.stdout:
-            print(result.stdout)
-        else:
-            print("(No output)")
-        
-        if result.stderr:
-            print("\nSTDERR:")
-            print(result.stderr)
-        
         print("=" * 50)
         print(f"Program exited with code: {result.returncode}")
         
@@ -215,6 +346,7 @@ def main():
     print("\n🗑️  Temporary files created:")
     print(f"   - {output_cpp}")
     print(f"   - program (executable)")
+    print(f"   (Cached builds are kept in {CACHE_DIR} - delete it to clear them)")
     cleanup = input("\nDelete temporary files? (y/n): ").lower().strip()
     if cleanup == 'y':
         try:
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Optional ahead-of-time build of the Lakbay transpiler
+
+Compiles lakbay.py into a C extension with mypyc. The compiled module
+is a drop-in replacement: runner.py imports it the same way.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Delete the generated lakbay.*.so (or .pyd) to go back to pure Python.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='lakbay',
+    version='1.0.0',
+    py_modules=['lakbay'],
+    ext_modules=mypycify(['lakbay.py']),
+)